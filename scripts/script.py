@@ -1,6 +1,18 @@
 import os
 from pathlib import Path
 
+def walk_structure(structure, path=""):
+    """Iteratively walk through the structure and yield file paths"""
+    stack = [(path, structure)]
+    while stack:
+        prefix, node = stack.pop()
+        for name, content in node.items():
+            current_path = f"{prefix}/{name}" if prefix else name
+            if isinstance(content, dict):
+                stack.append((current_path, content))
+            else:
+                yield (current_path, content)
+
 # Create the complete GitHub repository structure
 repo_structure = {
     "bi-predictive-analytics-platform": {
@@ -205,22 +217,9 @@ repo_structure = {
     }
 }
 
-print("Repository structure created!")
-print("Total files to generate:", sum(1 for path, content in walk_structure(repo_structure) if content != "empty"))
+# Walk the structure once and reuse the result for both counts
+files = [path for path, content in walk_structure(repo_structure) if content != "empty"]
 
-def walk_structure(structure, path=""):
-    """Recursively walk through the structure and yield file paths"""
-    for name, content in structure.items():
-        current_path = f"{path}/{name}" if path else name
-        if isinstance(content, dict):
-            yield from walk_structure(content, current_path)
-        else:
-            yield (current_path, content)
-
-# Count files
-file_count = 0
-for path, content in walk_structure(repo_structure):
-    if content != "empty":
-        file_count += 1
-
-print(f"Repository structure contains {file_count} files to be generated")
\ No newline at end of file
+print("Repository structure created!")
+print("Total files to generate:", len(files))
+print(f"Repository structure contains {len(files)} files to be generated")
\ No newline at end of file
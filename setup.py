@@ -2,111 +2,170 @@
 Setup script for Business Intelligence Platform
 """
 
-from setuptools import setup, find_packages
 import os
 
-# Read README for long description
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+# Directories find_packages would otherwise walk through at build time
+EXCLUDE_DIRS = {"node_modules", "__pycache__", ".venv", "data", "models_store", "artifacts", "dags"}
+
+
+def fast_find(root):
+    """Find packages under root without descending into non-package dirs.
+
+    Unlike setuptools.find_packages this prunes excluded and hidden
+    directories before os.walk recurses into them, so large data or
+    dependency trees never get scanned.
+    """
+    packages = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [
+            d for d in dirnames
+            if d not in EXCLUDE_DIRS and not d.startswith('.')
+        ]
+        if '__init__.py' in filenames and dirpath != root:
+            packages.append(os.path.relpath(dirpath, root).replace(os.sep, '.'))
+    return packages
 
 # Read requirements
-def read_requirements(filename):
-    """Read requirements from file and return as list."""
+def read_requirements(filename, _cache={}):
+    """Read requirements from file and return as list.
+
+    Streams the file line by line, follows -r includes, skips other
+    pip directives, and caches per filename so repeated extras that
+    reference the same file don't re-parse it.
+    """
+    if filename in _cache:
+        return _cache[filename]
+
+    requirements = []
     with open(filename, 'r') as f:
-        return [line.strip() for line in f.readlines() 
-                if line.strip() and not line.startswith('#')]
+        for line in (raw.strip() for raw in f):
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('-r '):
+                requirements.extend(read_requirements(line[3:].strip()))
+            elif not line.startswith('-'):
+                requirements.append(line)
+
+    _cache[filename] = requirements
+    return requirements
 
 # Version
 __version__ = "1.0.0"
 
-setup(
-    name="bi-predictive-analytics-platform",
-    version=__version__,
-    author="Your Name",
-    author_email="your.email@example.com",
-    description="End-to-End Business Intelligence Dashboard with Predictive & Prescriptive Analytics",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/yourusername/bi-predictive-analytics-platform",
-    project_urls={
-        "Bug Tracker": "https://github.com/yourusername/bi-predictive-analytics-platform/issues",
-        "Documentation": "https://github.com/yourusername/bi-predictive-analytics-platform/docs",
-        "Source Code": "https://github.com/yourusername/bi-predictive-analytics-platform",
-    },
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
-    classifiers=[
-        "Development Status :: 5 - Production/Stable",
-        "Intended Audience :: Developers",
-        "Intended Audience :: Financial and Insurance Industry",
-        "Intended Audience :: Science/Research",
-        "License :: OSI Approved :: MIT License",
-        "Operating System :: OS Independent",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-        "Topic :: Office/Business :: Financial",
-        "Topic :: Scientific/Engineering :: Artificial Intelligence",
-        "Topic :: Scientific/Engineering :: Information Analysis",
-        "Topic :: Software Development :: Libraries :: Python Modules",
-        "Framework :: FastAPI",
-        "Framework :: Dash",
-    ],
-    python_requires=">=3.11",
-    install_requires=read_requirements("requirements.txt"),
-    extras_require={
-        "dev": read_requirements("requirements-dev.txt"),
-        "testing": [
-            "pytest>=7.4.3",
-            "pytest-asyncio>=0.21.1",
-            "pytest-cov>=4.1.0",
-            "pytest-mock>=3.12.0",
-            "factory-boy>=3.3.0",
-            "httpx>=0.25.2",
-        ],
-        "docs": [
-            "mkdocs>=1.5.3",
-            "mkdocs-material>=9.5.2",
-            "mkdocs-mermaid2-plugin>=1.1.1",
+
+def main():
+    """Run setuptools; deferred so importing this file stays cheap.
+
+    Importing setuptools drags in the pkg_resources sys.path scan, which
+    tooling that only reads metadata from this file never needs.
+    """
+    from setuptools import setup
+
+    # Read README for long description
+    with open("README.md", "r", encoding="utf-8") as fh:
+        long_description = fh.read()
+
+    setup(
+        name="bi-predictive-analytics-platform",
+        version=__version__,
+        author="Your Name",
+        author_email="your.email@example.com",
+        description="End-to-End Business Intelligence Dashboard with Predictive & Prescriptive Analytics",
+        long_description=long_description,
+        long_description_content_type="text/markdown",
+        url="https://github.com/yourusername/bi-predictive-analytics-platform",
+        project_urls={
+            "Bug Tracker": "https://github.com/yourusername/bi-predictive-analytics-platform/issues",
+            "Documentation": "https://github.com/yourusername/bi-predictive-analytics-platform/docs",
+            "Source Code": "https://github.com/yourusername/bi-predictive-analytics-platform",
+        },
+        packages=fast_find("src"),
+        package_dir={"": "src"},
+        classifiers=[
+            "Development Status :: 5 - Production/Stable",
+            "Intended Audience :: Developers",
+            "Intended Audience :: Financial and Insurance Industry",
+            "Intended Audience :: Science/Research",
+            "License :: OSI Approved :: MIT License",
+            "Operating System :: OS Independent",
+            "Programming Language :: Python :: 3",
+            "Programming Language :: Python :: 3.11",
+            "Programming Language :: Python :: 3.12",
+            "Topic :: Office/Business :: Financial",
+            "Topic :: Scientific/Engineering :: Artificial Intelligence",
+            "Topic :: Scientific/Engineering :: Information Analysis",
+            "Topic :: Software Development :: Libraries :: Python Modules",
+            "Framework :: FastAPI",
+            "Framework :: Dash",
         ],
-        "ml": [
-            "tensorflow>=2.15.0",
-            "torch>=2.1.2",
-            "transformers>=4.36.2",
-            "spacy>=3.7.2",
+        python_requires=">=3.11",
+        install_requires=read_requirements("requirements.txt"),
+        extras_require={
+            "dev": read_requirements("requirements-dev.txt"),
+            "testing": [
+                "pytest>=7.4.3",
+                "pytest-asyncio>=0.21.1",
+                "pytest-cov>=4.1.0",
+                "pytest-mock>=3.12.0",
+                "factory-boy>=3.3.0",
+                "httpx>=0.25.2",
+            ],
+            "docs": [
+                "mkdocs>=1.5.3",
+                "mkdocs-material>=9.5.2",
+                "mkdocs-mermaid2-plugin>=1.1.1",
+            ],
+            "ml": [
+                "tensorflow>=2.15.0",
+                "torch>=2.1.2",
+                "transformers>=4.36.2",
+                "spacy>=3.7.2",
+            ],
+            "cloud": [
+                "boto3>=1.34.0",
+                "azure-storage-blob>=12.19.0",
+                "google-cloud-storage>=2.10.0",
+            ]
+        },
+        # Hand-written launchers instead of console_scripts: the generated
+        # wrappers import pkg_resources on every CLI invocation
+        scripts=[
+            "bin/bi-platform",
+            "bin/bi-dashboard",
+            "bin/bi-train",
+            "bin/bi-migrate",
         ],
-        "cloud": [
-            "boto3>=1.34.0",
-            "azure-storage-blob>=12.19.0",
-            "google-cloud-storage>=2.10.0",
-        ]
-    },
-    entry_points={
-        "console_scripts": [
-            "bi-platform=src.main:main",
-            "bi-dashboard=src.dashboard.app:main",
-            "bi-train=scripts.train_models:main",
-            "bi-migrate=scripts.migrate:main",
+        # Exhaustive globs instead of include_package_data, which shells
+        # out to the VCS to enumerate every tracked file on each build
+        package_data={
+            "": ["*.yaml", "*.yml", "*.json", "*.sql", "*.md"],
+            "src": [
+                "config/*.yaml",
+                "config/*.yml",
+                "config/*.json",
+                "alembic/*.py",
+                "alembic/*.ini",
+                "alembic/*.mako",
+                "alembic/versions/*.py",
+            ],
+        },
+        zip_safe=False,
+        keywords=[
+            "business intelligence",
+            "predictive analytics", 
+            "prescriptive analytics",
+            "machine learning",
+            "dashboard",
+            "fastapi",
+            "plotly",
+            "time series",
+            "anomaly detection",
+            "forecasting",
+            "data science",
+            "artificial intelligence"
         ],
-    },
-    include_package_data=True,
-    package_data={
-        "": ["*.yaml", "*.yml", "*.json", "*.sql", "*.md"],
-        "src": ["config/*", "alembic/*"],
-    },
-    zip_safe=False,
-    keywords=[
-        "business intelligence",
-        "predictive analytics", 
-        "prescriptive analytics",
-        "machine learning",
-        "dashboard",
-        "fastapi",
-        "plotly",
-        "time series",
-        "anomaly detection",
-        "forecasting",
-        "data science",
-        "artificial intelligence"
-    ],
-)
\ No newline at end of file
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,36 +2,81 @@
 Main application entry point for the Business Intelligence Platform.
 """
 
+import asyncio
+import importlib
+import logging
+import os
+import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-import uvicorn
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from fastapi.responses import ORJSONResponse
 from starlette.responses import Response
 
-from src.api.dependencies import get_settings
-from src.api.routes import predictions, anomaly, prescriptive, dashboard
-from src.core.config import get_settings as core_get_settings
+from src.core.config import get_settings
 from src.core.database import create_tables, close_db_connection
 from src.core.logging import setup_logging
 from src.utils.exceptions import BusinessIntelligenceException
 
 
+logger = logging.getLogger(__name__)
+
+
+# API routers, loaded lazily at startup so short-lived invocations
+# (CLI entry points, --help, health probes during boot) don't pay the
+# pandas/sklearn/plotly import chains the route modules drag in
+_ROUTES = [
+    ("src.api.routes.predictions", "/api/v1/predict", "Predictions"),
+    ("src.api.routes.anomaly", "/api/v1/anomaly", "Anomaly Detection"),
+    ("src.api.routes.prescriptive", "/api/v1/prescribe", "Prescriptive Analytics"),
+    ("src.api.routes.dashboard", "/api/v1/dashboard", "Dashboard"),
+]
+
+
+# Health-check callables bound once at startup; importing them pulls
+# sqlalchemy and the Slack SDK, which should never happen per request
+_check_database_connection = None
+_check_slack_connection = None
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     Lifespan context manager for startup and shutdown events.
     """
+    global _check_database_connection, _check_slack_connection
+
     # Startup
     setup_logging()
+    if not settings.enable_metrics:
+        # Lean mode: the default collectors poll gc stats and /proc on
+        # every scrape; drop them so an accidental scrape stays cheap
+        from prometheus_client import (
+            GC_COLLECTOR,
+            PLATFORM_COLLECTOR,
+            PROCESS_COLLECTOR,
+            REGISTRY,
+        )
+        for collector in (GC_COLLECTOR, PLATFORM_COLLECTOR, PROCESS_COLLECTOR):
+            try:
+                REGISTRY.unregister(collector)
+            except KeyError:
+                pass
+    from src.core.database import check_database_connection
+    from src.integrations.slack_bot import check_slack_connection
+    _check_database_connection = check_database_connection
+    _check_slack_connection = check_slack_connection
+    for module_name, prefix, tag in _ROUTES:
+        module = importlib.import_module(module_name)
+        app.include_router(module.router, prefix=prefix, tags=[tag])
     await create_tables()
-    
+
     yield
-    
+
     # Shutdown
     await close_db_connection()
 
@@ -44,19 +89,26 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# Get settings
-settings = core_get_settings()
+# Get settings. Per-request code reads the module-level constant below
+# instead of going through pydantic attribute lookup each time.
+settings = get_settings()
+DEBUG = settings.debug
 
-# Add middleware
+# Add middleware. Explicit method/header lists compile to frozenset
+# membership checks inside Starlette instead of the wildcard branch that
+# reflects request headers on every preflight. TrustedHostMiddleware is
+# added last so it sits outermost and rejects bogus hosts before any
+# CORS work runs.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With"],
 )
 
 app.add_middleware(
@@ -70,9 +122,9 @@ app.add_middleware(
 async def business_intelligence_exception_handler(
     request: Request, 
     exc: BusinessIntelligenceException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle custom business intelligence exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.error_code,
@@ -83,38 +135,76 @@ async def business_intelligence_exception_handler(
 
 
 @app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle general exceptions."""
-    return JSONResponse(
+    # Known client-side errors take a cheap path with no traceback work
+    if isinstance(exc, (ValueError, KeyError)):
+        return ORJSONResponse(
+            status_code=400,
+            content={
+                "error": "BAD_REQUEST",
+                "message": str(exc),
+                "details": None
+            }
+        )
+
+    # Frame-by-frame traceback formatting (and its linecache reads) only
+    # happens when ERROR-level logs are actually emitted
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "Unhandled exception on %s %s", request.method, request.url.path,
+            exc_info=exc
+        )
+
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "INTERNAL_SERVER_ERROR",
             "message": "An unexpected error occurred",
-            "details": str(exc) if settings.debug else None
+            "details": str(exc) if DEBUG else None
         }
     )
 
 
+# Static response bodies rendered once at import; liveness probes hit
+# /health every few seconds, so re-encoding the same dict per request
+# is pure waste
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "Business Intelligence Platform API",
+    "version": "1.0.0"
+})
+_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to the Business Intelligence Platform API",
+    "version": "1.0.0",
+    "documentation": "/docs",
+    "health": "/health",
+    "metrics": "/metrics"
+})
+
+
 # Health check endpoints
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "Business Intelligence Platform API",
-        "version": "1.0.0"
-    }
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/health/detailed", tags=["Health"])
 async def detailed_health_check():
     """Detailed health check with component status."""
-    from src.core.database import check_database_connection
-    from src.integrations.slack_bot import check_slack_connection
-    
+    # Run the network round-trips concurrently so the probe takes
+    # max(db, slack) instead of their sum; a per-check timeout keeps a
+    # hung dependency from pinning the probe and failing the pod
+    db_result, slack_result = await asyncio.gather(
+        asyncio.wait_for(_check_database_connection(), timeout=2.0),
+        asyncio.wait_for(_check_slack_connection(), timeout=2.0),
+        return_exceptions=True
+    )
+
     checks = {
-        "database": await check_database_connection(),
-        "slack": await check_slack_connection(),
+        "database": db_result is True,
+        "slack": slack_result is True,
         "redis": True,  # TODO: Implement Redis health check
     }
     
@@ -128,59 +218,58 @@ async def detailed_health_check():
     }
 
 
-# Metrics endpoint for Prometheus
-@app.get("/metrics", tags=["Monitoring"])
-async def metrics():
-    """Prometheus metrics endpoint."""
-    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+# Metrics endpoint for Prometheus. Rendering walks every collector in
+# Python, so bursty concurrent scrapes share one serialization pass via
+# a short-TTL cache guarded by a lock, keyed by the negotiated content
+# type so text and OpenMetrics scrapers never see each other's bodies.
+_METRICS_TTL = 1.0
+_METRICS_CACHE: dict = {}  # content type -> (monotonic timestamp, body)
+_METRICS_LOCK = asyncio.Lock()
 
 
-# Include API routers
-app.include_router(
-    predictions.router,
-    prefix="/api/v1/predict",
-    tags=["Predictions"]
-)
+@app.get("/metrics", tags=["Monitoring"])
+async def metrics(request: Request):
+    """Prometheus metrics endpoint."""
+    # Imported here so workers that never get scraped skip the
+    # prometheus_client default-collector registration
+    from prometheus_client import REGISTRY
+    from prometheus_client.exposition import choose_encoder
 
-app.include_router(
-    anomaly.router,
-    prefix="/api/v1/anomaly",
-    tags=["Anomaly Detection"]
-)
+    # OpenMetrics/protobuf when the scraper negotiates it
+    encoder, content_type = choose_encoder(request.headers.get("accept", ""))
 
-app.include_router(
-    prescriptive.router,
-    prefix="/api/v1/prescribe",
-    tags=["Prescriptive Analytics"]
-)
+    now = time.monotonic()
+    entry = _METRICS_CACHE.get(content_type)
+    if entry is None or now - entry[0] > _METRICS_TTL:
+        async with _METRICS_LOCK:
+            entry = _METRICS_CACHE.get(content_type)
+            if entry is None or now - entry[0] > _METRICS_TTL:
+                entry = (now, encoder(REGISTRY))
+                _METRICS_CACHE[content_type] = entry
 
-app.include_router(
-    dashboard.router,
-    prefix="/api/v1/dashboard",
-    tags=["Dashboard"]
-)
+    return Response(entry[1], media_type=content_type)
 
 
 # Root endpoint
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint with API information."""
-    return {
-        "message": "Welcome to the Business Intelligence Platform API",
-        "version": "1.0.0",
-        "documentation": "/docs",
-        "health": "/health",
-        "metrics": "/metrics"
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
-    # Development server
+    import uvicorn
+
+    # The file-watching reload supervisor only runs in debug; otherwise
+    # use the C event loop and HTTP parser with one worker per core
     uvicorn.run(
         "src.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        reload_dirs=["src"],
-        log_level="info"
+        host=settings.host,
+        port=settings.port,
+        reload=settings.debug,
+        reload_dirs=["src"] if settings.debug else None,
+        loop="uvloop",
+        http="httptools",
+        log_level=settings.log_level.lower(),
+        workers=1 if settings.debug else os.cpu_count()
     )
\ No newline at end of file
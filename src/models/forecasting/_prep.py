@@ -0,0 +1,99 @@
+"""
+Shared numeric preparation kernel for time series forecasting models.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
+
+def _prepare_y_impl(y: np.ndarray) -> np.ndarray:
+    """
+    Clean a target series in-place: forward fill NaNs, backfill leading
+    NaNs from the first observed value, then cap outliers at 1.5 IQR.
+
+    Args:
+        y: Contiguous float64 array, modified in place
+
+    Returns:
+        The same array, filled and clipped
+    """
+    n = y.size
+    if n == 0:
+        return y
+
+    # Forward fill in a single pass
+    last = np.nan
+    for i in range(n):
+        v = y[i]
+        if np.isnan(v):
+            y[i] = last
+        else:
+            last = v
+
+    # Backfill leading NaNs from the first non-NaN value
+    if np.isnan(y[0]):
+        first = np.nan
+        for i in range(n):
+            if not np.isnan(y[i]):
+                first = y[i]
+                break
+        for i in range(n):
+            if np.isnan(y[i]):
+                y[i] = first
+            else:
+                break
+
+    # IQR bounds via partial partitions (O(n) selection, no full sort)
+    k1 = n // 4
+    k2 = (3 * n) // 4
+    part = np.partition(y, k2)
+    q3 = part[k2]
+    q1 = np.partition(part[:k2 + 1], k1)[k1]
+    iqr = q3 - q1
+    lo = q1 - 1.5 * iqr
+    hi = q3 + 1.5 * iqr
+
+    # Cap outliers instead of removing them
+    for i in range(n):
+        v = y[i]
+        if v < lo:
+            y[i] = lo
+        elif v > hi:
+            y[i] = hi
+    return y
+
+
+if njit is not None:
+    # Module-level so the compiled kernel is cached across calls. No
+    # fastmath here: its nnan flag would let LLVM fold the np.isnan
+    # checks that drive the fill to false.
+    prepare_y = njit(cache=True)(_prepare_y_impl)
+else:
+    def prepare_y(y: np.ndarray) -> np.ndarray:
+        """NumPy fallback mirroring the jitted kernel."""
+        n = y.size
+        if n == 0:
+            return y
+
+        mask = np.isnan(y)
+        if mask.any():
+            # Vectorized forward fill via index propagation
+            idx = np.where(~mask, np.arange(n), 0)
+            np.maximum.accumulate(idx, out=idx)
+            y[:] = y[idx]
+            if np.isnan(y[0]):
+                valid = np.flatnonzero(~np.isnan(y))
+                if valid.size:
+                    y[:valid[0]] = y[valid[0]]
+
+        k1 = n // 4
+        k2 = (3 * n) // 4
+        part = np.partition(y, [k1, k2])
+        q1, q3 = part[k1], part[k2]
+        iqr = q3 - q1
+        np.clip(y, q1 - 1.5 * iqr, q3 + 1.5 * iqr, out=y)
+        return y
@@ -2,25 +2,133 @@
 Prophet-based time series forecasting model for business metrics.
 """
 
+import gzip
+import json
 import logging
+import math
+import os
 import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import product
 from typing import Dict, List, Optional, Tuple, Any
 
 import numpy as np
 import pandas as pd
 from prophet import Prophet
 from prophet.diagnostics import cross_validation, performance_metrics
-from sklearn.metrics import mean_absolute_percentage_error, mean_squared_error
+from prophet.serialize import model_to_json, model_from_json
 import joblib
 
+try:
+    import zstandard as zstd
+except ImportError:  # fall back to stdlib gzip compression
+    zstd = None
+
 from src.models.base_model import BaseModel
+from src.models.forecasting._prep import prepare_y
 from src.utils.exceptions import ModelTrainingException, PredictionException
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is an optional accelerator
+    njit = None
+    prange = range
+
 
 logger = logging.getLogger(__name__)
 
 
+def _default_stan_backend() -> Optional[str]:
+    """
+    Pick the NumPyro Stan backend when this Prophet build and numpyro can
+    actually provide it, otherwise fall back to Prophet's default.
+
+    Resolved once at import so the fallback is logged once, not per fit.
+    """
+    try:
+        from prophet.models import StanBackendEnum
+        if hasattr(StanBackendEnum, "NUMPYRO"):
+            import numpyro  # noqa: F401
+            return "NUMPYRO"
+    except ImportError:
+        pass
+    logger.info("NumPyro Stan backend unavailable, using Prophet's default")
+    return None
+
+
+_DEFAULT_STAN_BACKEND = _default_stan_backend()
+
+
+# Opt-in GPU execution for the NumPyro backend. Leapfrog steps become fused
+# XLA kernels on the GPU, and FP32 roughly doubles throughput there while
+# remaining adequate for trend posteriors. Cross-validation already runs
+# with thread workers under NumPyro, so the GPU device is never forked.
+if os.environ.get("PROPHET_GPU", "").lower() in ("1", "true", "yes"):
+    os.environ.setdefault("JAX_PLATFORMS", "cuda")
+    try:
+        import jax
+        jax.config.update("jax_enable_x64", False)
+    except ImportError:
+        logger.warning("PROPHET_GPU is set but JAX is not installed")
+
+
+def _metrics_impl(y: np.ndarray, p: np.ndarray) -> Tuple[float, ...]:
+    """
+    Accumulate the error sums behind MAPE/RMSE/MAE in a single pass
+    over two aligned float64 arrays.
+
+    Args:
+        y: Actual values
+        p: Predicted values
+
+    Returns:
+        Tuple of (sum of squared errors, sum of absolute errors, sum of
+        absolute relative errors, sum y, sum p, sum y^2, sum p^2, sum y*p)
+    """
+    sum_e2 = 0.0
+    sum_abs_e = 0.0
+    sum_abs_rel = 0.0
+    sum_y = 0.0
+    sum_p = 0.0
+    sum_y2 = 0.0
+    sum_p2 = 0.0
+    sum_yp = 0.0
+    for i in prange(y.size):
+        yi = y[i]
+        pi = p[i]
+        e = yi - pi
+        sum_e2 += e * e
+        sum_abs_e += abs(e)
+        sum_abs_rel += abs(e) / abs(yi)
+        sum_y += yi
+        sum_p += pi
+        sum_y2 += yi * yi
+        sum_p2 += pi * pi
+        sum_yp += yi * pi
+    return sum_e2, sum_abs_e, sum_abs_rel, sum_y, sum_p, sum_y2, sum_p2, sum_yp
+
+
+if njit is not None:
+    # Module-level so the compiled kernel is cached across calls
+    _metrics = njit(cache=True, parallel=True, fastmath=True)(_metrics_impl)
+else:
+    def _metrics(y: np.ndarray, p: np.ndarray) -> Tuple[float, ...]:
+        """NumPy fallback mirroring the jitted kernel."""
+        e = y - p
+        abs_e = np.abs(e)
+        return (
+            float(np.dot(e, e)),
+            float(abs_e.sum()),
+            float((abs_e / np.abs(y)).sum()),
+            float(y.sum()),
+            float(p.sum()),
+            float(np.dot(y, y)),
+            float(np.dot(p, p)),
+            float(np.dot(y, p)),
+        )
+
+
 class ProphetForecastingModel(BaseModel):
     """
     Prophet-based forecasting model with advanced features and hyperparameter optimization.
@@ -36,10 +144,11 @@ class ProphetForecastingModel(BaseModel):
         mcmc_samples: int = 0,
         interval_width: float = 0.95,
         uncertainty_samples: int = 1000,
+        stan_backend: Optional[str] = None,
         **kwargs
     ):
         super().__init__(name=name, **kwargs)
-        
+
         self.seasonality_mode = seasonality_mode
         self.changepoint_prior_scale = changepoint_prior_scale
         self.seasonality_prior_scale = seasonality_prior_scale
@@ -47,11 +156,16 @@ class ProphetForecastingModel(BaseModel):
         self.mcmc_samples = mcmc_samples
         self.interval_width = interval_width
         self.uncertainty_samples = uncertainty_samples
+        # None means auto: NumPyro when available, Prophet's default otherwise
+        self.stan_backend = stan_backend if stan_backend is not None else _DEFAULT_STAN_BACKEND
         
         self.model: Optional[Prophet] = None
         self.feature_columns: List[str] = []
         self.target_column: str = ""
         self.training_metrics: Dict[str, float] = {}
+        self._prepared_data: Optional[pd.DataFrame] = None
+        self._future_cache: Dict[Tuple[int, str, bool], pd.DataFrame] = {}
+        self._feature_importance: Dict[str, float] = {}
         
     def prepare_data(self, df: pd.DataFrame, target_col: str, date_col: str = "ds") -> pd.DataFrame:
         """
@@ -65,40 +179,27 @@ class ProphetForecastingModel(BaseModel):
         Returns:
             Prepared dataframe with Prophet format
         """
-        try:
-            # Create a copy of the dataframe
-            data = df.copy()
-            
-            # Rename columns to Prophet format
-            if date_col != "ds":
-                data = data.rename(columns={date_col: "ds"})
-            if target_col != "y":
-                data = data.rename(columns={target_col: "y"})
-            
-            # Ensure ds column is datetime
-            data["ds"] = pd.to_datetime(data["ds"])
-            
-            # Sort by date
-            data = data.sort_values("ds").reset_index(drop=True)
-            
-            # Handle missing values
-            data["y"] = data["y"].fillna(method="ffill").fillna(method="bfill")
-            
-            # Remove outliers using IQR method
-            Q1 = data["y"].quantile(0.25)
-            Q3 = data["y"].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            
-            # Cap outliers instead of removing them
-            data["y"] = data["y"].clip(lower=lower_bound, upper=upper_bound)
-            
-            logger.info(f"Prepared data with {len(data)} records")
-            return data
-            
-        except Exception as e:
-            raise ModelTrainingException(f"Data preparation failed: {str(e)}")
+        # Shallow rename to Prophet format; regressor columns are only
+        # read, so they can stay as views instead of deep copies
+        data = df.rename(columns={date_col: "ds", target_col: "y"}, copy=False)
+
+        # Ensure ds column is datetime without copying the other columns
+        data = data.assign(ds=pd.to_datetime(data["ds"].values))
+
+        # Sort by date via a stable argsort, skipping the take entirely
+        # when the input is already in order
+        order = np.argsort(data["ds"].values, kind="stable")
+        if (np.diff(order) < 0).any():
+            data = data.take(order)
+        data = data.reset_index(drop=True)
+
+        # Fill missing values and cap outliers in one fused kernel pass
+        y = data["y"].to_numpy(dtype=np.float64, copy=True)
+        prepare_y(y)
+        data["y"] = y
+
+        logger.info("Prepared data with %d records", len(data))
+        return data
     
     def add_regressors(self, model: Prophet, data: pd.DataFrame) -> Prophet:
         """
@@ -111,15 +212,26 @@ class ProphetForecastingModel(BaseModel):
         Returns:
             Prophet model with added regressors
         """
-        # Add common business regressors
-        regressor_columns = [col for col in data.columns if col not in ["ds", "y"]]
-        
+        # Add common business regressors: one vectorized dtype scan instead
+        # of a per-column Python dtype comparison
+        regressor_columns = [
+            col for col in data.select_dtypes(include=[np.number]).columns
+            if col not in ("ds", "y")
+        ]
+
+        # Feed Prophet contiguous float32 regressors: halves the bytes
+        # copied into Stan and is numerically adequate for trend inference.
+        # The y column stays float64 as Stan requires.
+        if regressor_columns:
+            data[regressor_columns] = data[regressor_columns].astype(np.float32, copy=False)
+
         for col in regressor_columns:
-            if data[col].dtype in [np.float64, np.int64, np.float32, np.int32]:
-                model.add_regressor(col)
-                self.feature_columns.append(col)
-                logger.info(f"Added regressor: {col}")
-        
+            model.add_regressor(col)
+        if logger.isEnabledFor(logging.INFO):
+            for col in regressor_columns:
+                logger.info("Added regressor: %s", col)
+        self.feature_columns.extend(regressor_columns)
+
         return model
     
     def add_custom_seasonalities(self, model: Prophet) -> Prophet:
@@ -163,13 +275,23 @@ class ProphetForecastingModel(BaseModel):
         """
         try:
             logger.info("Starting Prophet model training...")
-            
-            # Prepare data
+
+            if self.mcmc_samples > 0 and self.stan_backend != "NUMPYRO":
+                logger.warning(
+                    "MCMC sampling without the NumPyro backend runs on the "
+                    "CPU-only cmdstan sampler and will be slow"
+                )
+
+            # Prepare data and cache it for reuse by cross_validate;
+            # drop caches tied to the previous fit
+            self._prepared_data = None
+            self._future_cache.clear()
             prepared_data = self.prepare_data(data, target_col, date_col)
+            self._prepared_data = prepared_data
             self.target_column = target_col
             
             # Initialize Prophet model
-            self.model = Prophet(
+            model_params = dict(
                 seasonality_mode=self.seasonality_mode,
                 changepoint_prior_scale=self.changepoint_prior_scale,
                 seasonality_prior_scale=self.seasonality_prior_scale,
@@ -181,6 +303,19 @@ class ProphetForecastingModel(BaseModel):
                 weekly_seasonality=True,
                 yearly_seasonality=True
             )
+            if self.stan_backend:
+                # NumPyro's JIT'd optimizer/NUTS is much faster than cmdstan
+                # and drops the cmdstan toolchain dependency. The guard only
+                # covers explicitly requested backends; the auto default is
+                # resolved at import time.
+                try:
+                    self.model = Prophet(stan_backend=self.stan_backend, **model_params)
+                except Exception:
+                    logger.warning("Stan backend %s unavailable, using default", self.stan_backend)
+                    self.stan_backend = None
+                    self.model = Prophet(**model_params)
+            else:
+                self.model = Prophet(**model_params)
             
             # Add custom seasonalities
             self.model = self.add_custom_seasonalities(self.model)
@@ -196,6 +331,10 @@ class ProphetForecastingModel(BaseModel):
             
             # Calculate training metrics
             self._calculate_training_metrics(prepared_data)
+
+            # Regressor coefficients are invariant after fit, so cache the
+            # importance scores once instead of rebuilding them per call
+            self._cache_feature_importance()
             
             # Update metadata
             self.metadata.update({
@@ -215,14 +354,15 @@ class ProphetForecastingModel(BaseModel):
             return self
             
         except Exception as e:
-            raise ModelTrainingException(f"Prophet model training failed: {str(e)}")
+            raise ModelTrainingException(f"Prophet model training failed: {str(e)}") from e
     
     def predict(
         self, 
         periods: int = 30, 
         freq: str = 'D',
         include_history: bool = True,
-        future_regressors: Optional[pd.DataFrame] = None
+        future_regressors: Optional[pd.DataFrame] = None,
+        tile_size: int = 2048
     ) -> pd.DataFrame:
         """
         Generate forecasts using the trained Prophet model.
@@ -232,67 +372,97 @@ class ProphetForecastingModel(BaseModel):
             freq: Frequency of predictions ('D' for daily, 'W' for weekly, etc.)
             include_history: Whether to include historical fitted values
             future_regressors: Future values for regressors
-            
+            tile_size: Rows per prediction tile; long horizons are split
+                so the uncertainty-sampling matrix stays bounded
+
         Returns:
             Dataframe with forecasts and confidence intervals
         """
         if self.model is None:
             raise PredictionException("Model has not been trained yet")
         
-        try:
-            # Create future dataframe
-            future = self.model.make_future_dataframe(periods=periods, freq=freq, include_history=include_history)
-            
-            # Add future regressor values if provided
-            if future_regressors is not None and len(self.feature_columns) > 0:
-                for col in self.feature_columns:
-                    if col in future_regressors.columns:
-                        # Merge future regressor values
-                        future = future.merge(
-                            future_regressors[['ds', col]], 
-                            on='ds', 
-                            how='left'
-                        )
-                        # Forward fill missing values
-                        future[col] = future[col].fillna(method='ffill')
-            
-            # Generate predictions
+        # Create future dataframe, memoized per (periods, freq,
+        # include_history) since dashboards call predict repeatedly
+        # with the same horizon and only the regressors vary
+        key = (periods, freq, include_history)
+        future = self._future_cache.get(key)
+        if future is None:
+            future = self.model.make_future_dataframe(
+                periods=periods, freq=freq, include_history=include_history
+            )
+            self._future_cache[key] = future
+        future = future.copy()
+
+        # Add future regressor values if provided, joining all columns
+        # in one merge so the ds hash table is built only once
+        if future_regressors is not None and len(self.feature_columns) > 0:
+            cols = [c for c in self.feature_columns if c in future_regressors.columns]
+            if cols:
+                future = future.merge(
+                    future_regressors[['ds', *cols]],
+                    on='ds',
+                    how='left'
+                )
+                # Forward fill missing values
+                future[cols] = future[cols].ffill()
+
+        # Generate predictions. Long horizons are tiled so interval
+        # computation peaks at tile_size x uncertainty_samples instead of
+        # len(future) x uncertainty_samples; tiles run on threads since
+        # the heavy lifting happens outside the GIL.
+        if len(future) > tile_size:
+            chunks = np.array_split(future, math.ceil(len(future) / tile_size))
+            with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as executor:
+                forecasts = list(executor.map(self.model.predict, chunks))
+            forecast = pd.concat(forecasts, ignore_index=True)
+        else:
             forecast = self.model.predict(future)
-            
-            # Add additional metrics
-            forecast['prediction_date'] = datetime.now()
-            forecast['model_name'] = self.name
-            forecast['confidence_width'] = forecast['yhat_upper'] - forecast['yhat_lower']
-            forecast['relative_uncertainty'] = forecast['confidence_width'] / np.abs(forecast['yhat'])
-            
-            logger.info(f"Generated {len(forecast)} predictions")
-            return forecast
-            
-        except Exception as e:
-            raise PredictionException(f"Prediction failed: {str(e)}")
+
+        # Add additional metrics, computed on raw ndarrays so no
+        # intermediate Series are allocated. The scalar stamp and model
+        # name broadcast as native datetime64/categorical columns rather
+        # than per-row Python objects.
+        n = len(forecast)
+        ts = np.datetime64(datetime.now(), 'ns')
+        forecast['prediction_date'] = np.full(n, ts, dtype='datetime64[ns]')
+        forecast['model_name'] = pd.Categorical.from_codes(
+            np.zeros(n, dtype=np.int8), categories=[self.name]
+        )
+        yhat = forecast['yhat'].to_numpy()
+        width = forecast['yhat_upper'].to_numpy() - forecast['yhat_lower'].to_numpy()
+        rel = width / np.abs(yhat)
+        forecast['confidence_width'] = width
+        forecast['relative_uncertainty'] = rel
+
+        logger.info("Generated %d predictions", len(forecast))
+        return forecast
     
     def _calculate_training_metrics(self, data: pd.DataFrame):
         """Calculate and store training metrics."""
-        try:
-            # In-sample predictions
-            forecast = self.model.predict(data)
-            
-            # Calculate metrics
-            mape = mean_absolute_percentage_error(data['y'], forecast['yhat'])
-            rmse = np.sqrt(mean_squared_error(data['y'], forecast['yhat']))
-            mae = np.mean(np.abs(data['y'] - forecast['yhat']))
-            
-            self.training_metrics = {
-                'mape': float(mape),
-                'rmse': float(rmse),
-                'mae': float(mae),
-                'r2': float(np.corrcoef(data['y'], forecast['yhat'])[0, 1] ** 2)
-            }
-            
-            logger.info(f"Training metrics - MAPE: {mape:.4f}, RMSE: {rmse:.4f}")
-            
-        except Exception as e:
-            logger.warning(f"Could not calculate training metrics: {str(e)}")
+        # In-sample predictions
+        forecast = self.model.predict(data)
+
+        # Calculate metrics with a single fused pass over both arrays
+        y = data['y'].to_numpy(dtype=np.float64)
+        yhat = forecast['yhat'].to_numpy(dtype=np.float64)
+        n = y.size
+        sum_e2, sum_abs_e, sum_abs_rel, sum_y, sum_p, sum_y2, sum_p2, sum_yp = _metrics(y, yhat)
+        mape = sum_abs_rel / n
+        rmse = np.sqrt(sum_e2 / n)
+        mae = sum_abs_e / n
+
+        # Pearson r^2 straight from the accumulated sums; no extra pass
+        denom = (n * sum_y2 - sum_y ** 2) * (n * sum_p2 - sum_p ** 2)
+        r2 = (n * sum_yp - sum_y * sum_p) ** 2 / denom if denom > 0 else 0.0
+
+        self.training_metrics = {
+            'mape': float(mape),
+            'rmse': float(rmse),
+            'mae': float(mae),
+            'r2': float(r2)
+        }
+
+        logger.info("Training metrics - MAPE: %.4f, RMSE: %.4f", mape, rmse)
     
     def cross_validate(
         self, 
@@ -300,7 +470,8 @@ class ProphetForecastingModel(BaseModel):
         horizon: str = '30 days',
         initial: str = '365 days',
         period: str = '30 days',
-        parallel: str = None
+        parallel: Optional[str] = 'auto',
+        force_reprepare: bool = False
     ) -> pd.DataFrame:
         """
         Perform cross-validation on the model.
@@ -310,18 +481,38 @@ class ProphetForecastingModel(BaseModel):
             horizon: Forecast horizon for each split
             initial: Initial training period
             period: Period between cutoff dates
-            parallel: Parallelization method
-            
+            parallel: Parallelization method; 'auto' picks 'processes' on
+                multi-core machines ('threads' under the NumPyro backend),
+                None forces sequential refits
+            force_reprepare: Re-run data preparation even when the data
+                prepared during fit() can be reused
+
         Returns:
             Cross-validation results
         """
         if self.model is None:
             raise PredictionException("Model has not been trained yet")
-        
+
         try:
-            # Prepare data
-            prepared_data = self.prepare_data(data, self.target_column)
-            
+            # Cutoff refits are embarrassingly parallel, so use all cores
+            # by default. The NumPyro backend shares a JAX device that does
+            # not survive forking, so fall back to threads there.
+            if parallel == 'auto':
+                import multiprocessing as mp
+                if self.stan_backend == "NUMPYRO":
+                    parallel = 'threads'
+                elif mp.cpu_count() > 1:
+                    parallel = 'processes'
+                else:
+                    parallel = None
+
+            # Reuse the data prepared during fit() on the common
+            # "cross-validate right after fit" pattern
+            if not force_reprepare and self._prepared_data is not None:
+                prepared_data = self._prepared_data
+            else:
+                prepared_data = self.prepare_data(data, self.target_column)
+
             # Perform cross-validation
             cv_results = cross_validation(
                 self.model,
@@ -335,37 +526,72 @@ class ProphetForecastingModel(BaseModel):
             # Calculate performance metrics
             performance = performance_metrics(cv_results)
             
-            logger.info(f"Cross-validation completed with {len(cv_results)} splits")
+            logger.info("Cross-validation completed with %d splits", len(cv_results))
             return cv_results, performance
             
         except Exception as e:
-            raise ModelTrainingException(f"Cross-validation failed: {str(e)}")
+            raise ModelTrainingException(f"Cross-validation failed: {str(e)}") from e
     
+    @classmethod
+    def grid_search(
+        cls,
+        param_grid: Dict[str, List[Any]],
+        data: pd.DataFrame,
+        target_col: str,
+        horizon: str = '30 days',
+        initial: str = '365 days',
+        period: str = '30 days',
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Sweep hyperparameter combinations in parallel worker processes.
+
+        Each combination is fitted and cross-validated on its own worker;
+        inner cross-validation parallelism is disabled to avoid nested
+        process pools.
+
+        Args:
+            param_grid: Mapping of constructor argument to candidate values
+            data: Historical data
+            target_col: Target column name
+            horizon: Forecast horizon for each CV split
+            initial: Initial training period
+            period: Period between cutoff dates
+            max_workers: Worker process count (defaults to CPU count)
+
+        Returns:
+            List of {'params', 'rmse'} dicts sorted by ascending RMSE
+        """
+        combos = [dict(zip(param_grid, values)) for values in product(*param_grid.values())]
+        args = [(params, data, target_col, horizon, initial, period) for params in combos]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_fit_and_score, args))
+
+        results.sort(key=lambda result: result['rmse'])
+        logger.info("Grid search evaluated %d combinations", len(results))
+        return results
+
+    def _cache_feature_importance(self):
+        """Cache regressor importance scores from the current model."""
+        self._feature_importance = {
+            regressor: abs(float(self.model.extra_regressors[regressor].get('coef', 0.0)))
+            for regressor in getattr(self.model, 'extra_regressors', {})
+        }
+
     def get_feature_importance(self) -> Dict[str, float]:
         """
         Get feature importance from the trained model.
-        
+
         Returns:
             Dictionary of feature importance scores
         """
         if self.model is None:
             return {}
-        
-        try:
-            # Get regressor coefficients
-            importance = {}
-            
-            if hasattr(self.model, 'extra_regressors'):
-                for regressor in self.model.extra_regressors:
-                    # Get the regressor coefficient from the model
-                    regressor_coef = self.model.extra_regressors[regressor].get('coef', 0)
-                    importance[regressor] = abs(float(regressor_coef))
-            
-            return importance
-            
-        except Exception as e:
-            logger.warning(f"Could not calculate feature importance: {str(e)}")
-            return {}
+
+        # Cached during fit() and load_model(); invariant until the model
+        # is retrained or replaced
+        return self._feature_importance
     
     def save_model(self, filepath: str):
         """Save the trained model to disk."""
@@ -373,35 +599,58 @@ class ProphetForecastingModel(BaseModel):
             raise ValueError("No model to save")
         
         try:
-            model_data = {
-                'model': self.model,
+            # Prophet-native JSON is version-portable and far smaller than
+            # pickling the whole Stan fit object through joblib
+            payload = json.dumps({
+                'model': model_to_json(self.model),
                 'feature_columns': self.feature_columns,
                 'target_column': self.target_column,
                 'training_metrics': self.training_metrics,
                 'metadata': self.metadata
-            }
-            
-            joblib.dump(model_data, filepath)
-            logger.info(f"Prophet model saved to {filepath}")
-            
+            }).encode("utf-8")
+
+            if zstd is not None:
+                blob = zstd.ZstdCompressor(level=3).compress(payload)
+            else:
+                blob = gzip.compress(payload)
+
+            with open(filepath, 'wb') as f:
+                f.write(blob)
+            logger.info("Prophet model saved to %s", filepath)
+
         except Exception as e:
-            raise Exception(f"Failed to save model: {str(e)}")
+            raise Exception(f"Failed to save model: {str(e)}") from e
     
     def load_model(self, filepath: str):
         """Load a trained model from disk."""
         try:
-            model_data = joblib.load(filepath)
-            
+            with open(filepath, 'rb') as f:
+                blob = f.read()
+
+            if blob[:4] == b'\x28\xb5\x2f\xfd' and zstd is not None:
+                model_data = json.loads(zstd.ZstdDecompressor().decompress(blob))
+                model_data['model'] = model_from_json(model_data['model'])
+            elif blob[:2] == b'\x1f\x8b':
+                model_data = json.loads(gzip.decompress(blob))
+                model_data['model'] = model_from_json(model_data['model'])
+            else:
+                # Legacy joblib artifact
+                model_data = joblib.load(filepath)
+
             self.model = model_data['model']
             self.feature_columns = model_data['feature_columns']
             self.target_column = model_data['target_column']
             self.training_metrics = model_data['training_metrics']
             self.metadata = model_data['metadata']
-            
-            logger.info(f"Prophet model loaded from {filepath}")
+
+            # Restored models carry their regressor coefficients, so the
+            # importance cache can be rebuilt without refitting
+            self._cache_feature_importance()
+
+            logger.info("Prophet model loaded from %s", filepath)
             
         except Exception as e:
-            raise Exception(f"Failed to load model: {str(e)}")
+            raise Exception(f"Failed to load model: {str(e)}") from e
     
     def get_model_summary(self) -> Dict[str, Any]:
         """Get a summary of the trained model."""
@@ -421,4 +670,21 @@ class ProphetForecastingModel(BaseModel):
                 "holidays_prior_scale": self.holidays_prior_scale,
             },
             "metadata": self.metadata
-        }
\ No newline at end of file
+        }
+
+
+def _fit_and_score(args: Tuple[Dict[str, Any], pd.DataFrame, str, str, str, str]) -> Dict[str, Any]:
+    """
+    Fit one hyperparameter combination and score it by cross-validated RMSE.
+
+    Module-level so it can be pickled into grid_search worker processes.
+    """
+    params, data, target_col, horizon, initial, period = args
+
+    model = ProphetForecastingModel(**params)
+    model.fit(data, target_col)
+    # Sequential CV: each combination already owns a whole worker process
+    _, performance = model.cross_validate(
+        data, horizon=horizon, initial=initial, period=period, parallel=None
+    )
+    return {'params': params, 'rmse': float(performance['rmse'].mean())}
\ No newline at end of file